@@ -1,4 +1,4 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import List
 import os
 
@@ -40,12 +40,12 @@ class Settings(BaseSettings):
         """Get allowed audio types as list."""
         return [t.strip() for t in self.allowed_audio_types.split(",")]
     
-    model_config = {
-        'env_file': os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env'),
-        'env_file_encoding': 'utf-8',
-        'case_sensitive': False,
-        'extra': 'allow'
-    }
+    model_config = SettingsConfigDict(
+        env_file=os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env'),
+        env_file_encoding='utf-8',
+        case_sensitive=False,
+        extra='allow'
+    )
 
 # Create global settings instance
 settings = Settings()
@@ -1,12 +1,14 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 import logging
 import os
 
-from app.config import settings
+from app.config import settings, create_upload_dirs
 from app.utils.database import connect_to_mongo, close_mongo_connection, ping_database
+from app.utils.security import warm_up_pwd_context
 from app.routers.v1 import health
 
 # Configure logging
@@ -26,9 +28,11 @@ async def lifespan(app: FastAPI):
     await connect_to_mongo()
     
     # Ensure upload directories exist
-    from app.config import create_upload_dirs
     create_upload_dirs()
     
+    # Load password hashing backends so the first login doesn't pay for it
+    warm_up_pwd_context()
+    
     logger.info("Startup completed successfully")
     
     yield
@@ -45,6 +49,7 @@ app = FastAPI(
     description="A comprehensive learning management system focused on flashcard-based learning with spaced repetition algorithm (SM-2).",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
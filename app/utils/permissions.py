@@ -1,13 +1,13 @@
-from enum import Enum
+from enum import StrEnum
 from typing import List
 
-class UserRole(str, Enum):
+class UserRole(StrEnum):
     """User roles enum."""
     STUDENT = "student"
     TEACHER = "teacher"
     ADMIN = "admin"
 
-class StudyMode(str, Enum):
+class StudyMode(StrEnum):
     """Study modes enum."""
     REVIEW = "review"
     PRACTICE = "practice"
@@ -15,28 +15,38 @@ class StudyMode(str, Enum):
     TEST = "test"
     LEARN = "learn"
 
-class DifficultyLevel(str, Enum):
+class DifficultyLevel(StrEnum):
     """Difficulty levels for flashcards."""
     EASY = "easy"
     MEDIUM = "medium"
     HARD = "hard"
 
-class PermissionLevel(str, Enum):
+class PermissionLevel(StrEnum):
     """Permission levels for resources."""
     PRIVATE = "private"
     SHARED = "shared"
     PUBLIC = "public"
 
+# Role hierarchy levels, built once at import
+ROLE_HIERARCHY = {
+    UserRole.ADMIN: 3,
+    UserRole.TEACHER: 2,
+    UserRole.STUDENT: 1
+}
+
+# Roles allowed to access shared resources
+SHARED_ACCESS_ROLES = frozenset({UserRole.TEACHER, UserRole.ADMIN})
+
+# Roles allowed per permission level, in hierarchy order
+ALLOWED_ROLES_BY_PERMISSION = {
+    PermissionLevel.PUBLIC: (UserRole.STUDENT, UserRole.TEACHER, UserRole.ADMIN),
+    PermissionLevel.SHARED: (UserRole.TEACHER, UserRole.ADMIN),
+}
+
 def check_user_permission(user_role: str, required_role: str) -> bool:
     """Check if user has required permission level."""
-    role_hierarchy = {
-        UserRole.ADMIN: 3,
-        UserRole.TEACHER: 2,
-        UserRole.STUDENT: 1
-    }
-    
-    user_level = role_hierarchy.get(user_role, 0)
-    required_level = role_hierarchy.get(required_role, 0)
+    user_level = ROLE_HIERARCHY.get(user_role, 0)
+    required_level = ROLE_HIERARCHY.get(required_role, 0)
     
     return user_level >= required_level
 
@@ -57,15 +67,11 @@ def can_access_resource(user_role: str, resource_owner_id: str, user_id: str,
         return True
     elif permission_level == PermissionLevel.SHARED:
         # Teachers can access shared resources
-        return user_role in [UserRole.TEACHER, UserRole.ADMIN]
+        return user_role in SHARED_ACCESS_ROLES
     else:  # PRIVATE
         return False
 
 def get_allowed_roles_for_permission(permission_level: str) -> List[str]:
     """Get list of roles that can access a resource with given permission level."""
-    if permission_level == PermissionLevel.PUBLIC:
-        return [UserRole.STUDENT, UserRole.TEACHER, UserRole.ADMIN]
-    elif permission_level == PermissionLevel.SHARED:
-        return [UserRole.TEACHER, UserRole.ADMIN]
-    else:  # PRIVATE
-        return []  # Only owner can access
+    # PRIVATE (or unknown) levels fall through to an empty list: only owner can access
+    return list(ALLOWED_ROLES_BY_PERMISSION.get(permission_level, ()))
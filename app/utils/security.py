@@ -1,46 +1,84 @@
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
+from functools import cache, lru_cache
 from typing import Optional
-from jose import JWTError, jwt
+import jwt
+from jwt import InvalidTokenError
 from passlib.context import CryptContext
 from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from app.config import settings
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Token signing parameters, resolved once from settings
+ACCESS_TOKEN_EXPIRE = timedelta(minutes=settings.access_token_expire_minutes)
+JWT_ALGORITHMS = [settings.algorithm]
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+@cache
+def get_pwd_context() -> CryptContext:
+    """Get the shared password hashing context, built on first use.
 
-def get_password_hash(password: str) -> str:
-    """Generate password hash."""
-    return pwd_context.hash(password)
+    New hashes use argon2id; existing bcrypt hashes still verify and are
+    reported by ``needs_update`` so they can be rehashed on next login.
+    """
+    return CryptContext(
+        schemes=["argon2", "bcrypt"],
+        deprecated="auto",
+        argon2__type="ID",
+        argon2__time_cost=2,
+        argon2__memory_cost=65536,
+        argon2__parallelism=1,
+        bcrypt__rounds=12
+    )
+
+def warm_up_pwd_context() -> None:
+    """Build the hashing context and load its backends ahead of the first login."""
+    pwd_context = get_pwd_context()
+    for scheme in pwd_context.schemes():
+        pwd_context.handler(scheme).get_backend()
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash without blocking the event loop."""
+    return await run_in_threadpool(get_pwd_context().verify, plain_password, hashed_password)
+
+async def get_password_hash(password: str) -> str:
+    """Generate password hash without blocking the event loop."""
+    return await run_in_threadpool(get_pwd_context().hash, password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token."""
     to_encode = data.copy()
+    # JWT NumericDate claims are POSIX seconds; avoid datetime round-trips
+    now = int(time.time())
     
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
+    expire = now + int((expires_delta or ACCESS_TOKEN_EXPIRE).total_seconds())
     
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "iat": now})
     encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
     
     return encoded_jwt
 
+@lru_cache(maxsize=1024)
+def _decode_token(token: str) -> dict:
+    """Decode and fully validate a JWT; results are cached per token string."""
+    return jwt.decode(token, settings.secret_key, algorithms=JWT_ALGORITHMS)
+
 def verify_token(token: str) -> dict:
     """Verify and decode JWT token."""
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        return payload
-    except JWTError:
+        payload = _decode_token(token)
+    except InvalidTokenError:
+        payload = None
+    
+    # Cached payloads were valid when decoded, so only expiry can change since
+    exp = payload.get("exp") if payload else None
+    if payload is None or (exp is not None and time.time() >= exp):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    
+    return dict(payload)
 
 def create_token_data(user_id: str, email: str, role: str) -> dict:
     """Create token data dictionary."""
@@ -0,0 +1,40 @@
+import jwt
+import pytest
+import time
+from datetime import timedelta
+from fastapi import HTTPException
+from app.utils import security
+from app.utils.security import create_access_token, verify_token, create_token_data
+
+def test_access_token_round_trip():
+    """Test that a created token decodes back to its claims."""
+    token = create_access_token(create_token_data("user-1", "user@example.com", "student"))
+    payload = verify_token(token)
+    assert payload["sub"] == "user-1"
+    assert payload["role"] == "student"
+    assert payload["exp"] > payload["iat"]
+
+def test_foreign_signature_rejected():
+    """Test that a token signed with another key is rejected."""
+    token = jwt.encode({"sub": "user-1"}, "not-the-secret-key", algorithm="HS256")
+    with pytest.raises(HTTPException) as exc_info:
+        verify_token(token)
+    assert exc_info.value.status_code == 401
+
+def test_expired_token_rejected():
+    """Test that an expired token is rejected."""
+    token = create_access_token({"sub": "user-1"}, expires_delta=timedelta(seconds=-1))
+    with pytest.raises(HTTPException) as exc_info:
+        verify_token(token)
+    assert exc_info.value.status_code == 401
+
+def test_cached_token_expires(monkeypatch):
+    """Test that a cached token is still rejected once it expires."""
+    token = create_access_token({"sub": "user-1"}, expires_delta=timedelta(minutes=1))
+    assert verify_token(token)["sub"] == "user-1"
+    
+    later = time.time() + 120
+    monkeypatch.setattr(security.time, "time", lambda: later)
+    with pytest.raises(HTTPException) as exc_info:
+        verify_token(token)
+    assert exc_info.value.status_code == 401